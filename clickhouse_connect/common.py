@@ -81,3 +81,7 @@ _init_common('send_os_user', (True, False), True)
 _init_common('use_protocol_version', (True, False), True)
 
 _init_common('max_error_size', (), 1024)
+
+# Share a single Python object for each distinct value in a FixedString column.  This reduces memory for low
+# cardinality data such as currency or country codes, but adds a dictionary lookup per value
+_init_common('intern_fixed_strings', (True, False), False)
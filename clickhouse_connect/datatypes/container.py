@@ -2,6 +2,8 @@ import array
 import logging
 from typing import Sequence, Collection
 
+from clickhouse_connect.driver.ctypes import data_conv
+from clickhouse_connect.driver.errors import handle_error
 from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.query import QueryContext, quote_identifier
 from clickhouse_connect.driver.types import ByteSource
@@ -14,13 +16,22 @@ logger = logging.getLogger(__name__)
 
 
 class Array(ClickHouseType):
-    __slots__ = ('element_type',)
+    __slots__ = 'element_type', 'final_type', 'depth'
     python_type = list
 
     def __init__(self, type_def: TypeDef):
         super().__init__(type_def)
         self.element_type = get_from_name(type_def.values[0])
         self._name_suffix = f'({self.element_type.name})'
+        # Nested arrays are read and written as one offset level per array depth, followed by the flattened
+        # values of the innermost element type.  Since types are immutable, resolve that structure once here
+        final_type = self.element_type
+        depth = 1
+        while isinstance(final_type, Array):
+            depth += 1
+            final_type = final_type.element_type
+        self.final_type = final_type
+        self.depth = depth
 
     def read_column_prefix(self, source: ByteSource):
         return self.element_type.read_column_prefix(source)
@@ -35,41 +46,30 @@ class Array(ClickHouseType):
 
     # pylint: disable=too-many-locals
     def read_column_data(self, source: ByteSource, num_rows: int, ctx: QueryContext):
-        final_type = self.element_type
-        depth = 1
-        while isinstance(final_type, Array):
-            depth += 1
-            final_type = final_type.element_type
         level_size = num_rows
         offset_sizes = []
-        for _ in range(depth):
+        for _ in range(self.depth):
             level_offsets = source.read_array('Q', level_size)
             offset_sizes.append(level_offsets)
             level_size = level_offsets[-1] if level_offsets else 0
         if level_size:
-            all_values = final_type.read_column_data(source, level_size, ctx)
+            all_values = self.final_type.read_column_data(source, level_size, ctx)
         else:
             all_values = []
-        column = all_values if isinstance(all_values, list) else list(all_values)
+        if isinstance(all_values, array.array):
+            # Fixed width numeric elements are read as a single flat array, so convert them all in one C call
+            column = all_values.tolist()
+        else:
+            column = all_values if isinstance(all_values, list) else list(all_values)
         for offset_range in reversed(offset_sizes):
-            data = []
-            last = 0
-            for x in offset_range:
-                data.append(column[last: x])
-                last = x
-            column = data
+            column = data_conv.build_array_column(column, offset_range)
         return column
 
     def write_column_prefix(self, dest: bytearray):
         self.element_type.write_column_prefix(dest)
 
     def write_column_data(self, column: Sequence, dest: bytearray, ctx: InsertContext):
-        final_type = self.element_type
-        depth = 1
-        while isinstance(final_type, Array):
-            depth += 1
-            final_type = final_type.element_type
-        for _ in range(depth):
+        for _ in range(self.depth):
             total = 0
             data = []
             offsets = array.array('Q')
@@ -79,9 +79,9 @@ class Array(ClickHouseType):
                 data.extend(x)
             if must_swap:
                 offsets.byteswap()
-            dest += offsets.tobytes()
+            dest += offsets
             column = data
-        final_type.write_column_data(column, dest, ctx)
+        self.final_type.write_column_data(column, dest, ctx)
 
 
 class Tuple(ClickHouseType):
@@ -122,12 +122,15 @@ class Tuple(ClickHouseType):
         for e_type in self.element_types:
             column = e_type.read_column_data(source, num_rows, ctx)
             columns.append(column)
-        if e_names and self.read_format(ctx) != 'tuple':
+        read_format = self.read_format(ctx) if e_names else 'tuple'
+        if read_format != 'tuple':
+            # Fill the row dictionaries one element column at a time, since the columns are already decoded
+            # independently this avoids indexing into every column for every row
             dicts = [{} for _ in range(num_rows)]
-            for ix, x in enumerate(dicts):
-                for y, key in enumerate(e_names):
-                    x[key] = columns[y][ix]
-            if self.read_format(ctx) == 'json':
+            for key, column in zip(e_names, columns):
+                for x, value in zip(dicts, column):
+                    x[key] = value
+            if read_format == 'json':
                 to_json = any_to_json
                 return [to_json(x) for x in dicts]
             return dicts
@@ -146,12 +149,7 @@ class Tuple(ClickHouseType):
             e_type.write_column_data(elem_column, dest, ctx)
 
     def convert_dict_insert(self, column: Sequence) -> Sequence:
-        names = self.element_names
-        col = [[] for _ in names]
-        for x in column:
-            for ix, name in enumerate(names):
-                col[ix].append(x.get(name))
-        return col
+        return [[x.get(name) for x in column] for name in self.element_names]
 
 
 class Point(Tuple):
@@ -184,20 +182,12 @@ class Map(ClickHouseType):
         self.key_type.read_column_prefix(source)
         self.value_type.read_column_prefix(source)
 
-    # pylint: disable=too-many-locals
     def read_column_data(self, source: ByteSource, num_rows: int, ctx: QueryContext):
         offsets = source.read_array('Q', num_rows)
         total_rows = 0 if len(offsets) == 0 else offsets[-1]
         keys = self.key_type.read_column_data(source, total_rows, ctx)
         values = self.value_type.read_column_data(source, total_rows, ctx)
-        all_pairs = tuple(zip(keys, values))
-        column = []
-        app = column.append
-        last = 0
-        for offset in offsets:
-            app(dict(all_pairs[last: offset]))
-            last = offset
-        return column
+        return data_conv.build_map_column(keys, values, offsets)
 
     def write_column_prefix(self, dest: bytearray):
         self.key_type.write_column_prefix(dest)
@@ -215,7 +205,7 @@ class Map(ClickHouseType):
             values.extend(v.values())
         if must_swap:
             offsets.byteswap()
-        dest += offsets.tobytes()
+        dest += offsets
         self.key_type.write_column_data(keys, dest, ctx)
         self.value_type.write_column_data(values, dest, ctx)
 
@@ -273,35 +263,13 @@ class JSON(ClickHouseType):
                 total += len(any_to_json(x))
         return total // len(sample) + 1
 
-    # pylint: disable=duplicate-code
     def write_column_data(self, column: Sequence, dest: bytearray, ctx: InsertContext):
-        app = dest.append
         first = self._first_value(column)
         if isinstance(first, str) or self.write_format(ctx) == 'string':
-            for x in column:
-                v = x.encode()
-                sz = len(v)
-                while True:
-                    b = sz & 0x7f
-                    sz >>= 7
-                    if sz == 0:
-                        app(b)
-                        break
-                    app(0x80 | b)
-                dest += v
+            handle_error(data_conv.write_str_col(column, False, 'utf8', dest))
         else:
             to_json = any_to_json
-            for x in column:
-                v = to_json(x)
-                sz = len(v)
-                while True:
-                    b = sz & 0x7f
-                    sz >>= 7
-                    if sz == 0:
-                        app(b)
-                        break
-                    app(0x80 | b)
-                dest += v
+            handle_error(data_conv.write_str_col([to_json(x) for x in column], False, None, dest))
 
 
 class Object(JSON):
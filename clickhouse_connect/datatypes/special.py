@@ -1,14 +1,18 @@
+import array
+import struct
 from typing import Union, Sequence, MutableSequence
 from uuid import UUID as PYUUID
 
 from clickhouse_connect.datatypes.base import TypeDef, ClickHouseType, ArrayType, UnsupportedType
 from clickhouse_connect.datatypes.registry import get_from_name
 from clickhouse_connect.driver.ctypes import data_conv
+from clickhouse_connect.driver.exceptions import DataError
 from clickhouse_connect.driver.insert import InsertContext
 from clickhouse_connect.driver.query import QueryContext
 from clickhouse_connect.driver.types import ByteSource
 
 empty_uuid_b = bytes(b'\x00' * 16)
+_UUID_STRUCT = struct.Struct('<QQ')  # High and low UInt64 halves of a UUID
 
 
 class UUID(ClickHouseType):
@@ -26,45 +30,50 @@ class UUID(ClickHouseType):
 
     @staticmethod
     def _read_binary_str(source: ByteSource, num_rows: int):
-        v = source.read_array('Q', num_rows * 2)
-        column = []
-        app = column.append
-        for i in range(num_rows):
-            ix = i << 1
-            x = f'{(v[ix] << 64 | v[ix + 1]):032x}'
-            app(f'{x[:8]}-{x[8:12]}-{x[12:16]}-{x[16:20]}-{x[20:]}')
-        return column
+        # Each UUID is two little endian UInt64 values (high bits first).  Reversing the bytes of each value
+        # yields big endian regardless of the host byte order, so the hex digits for the entire column can be
+        # generated in one call, leaving only the slicing to do per row
+        v = array.array('Q', source.read_bytes(num_rows * 16))
+        v.byteswap()
+        h = v.tobytes().hex()
+        return [f'{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}'
+                for i in range(0, num_rows * 32, 32)]
 
     # pylint: disable=too-many-branches
     def _write_column_binary(self, column: Union[Sequence, MutableSequence], dest: bytearray, ctx: InsertContext):
         first = self._first_value(column)
         empty = empty_uuid_b
+        pack = _UUID_STRUCT.pack
         if isinstance(first, str) or self.write_format(ctx) == 'string':
             for v in column:
                 if v:
                     x = int(v.replace('-', ''), 16)
-                    dest += (x >> 64).to_bytes(8, 'little') + (x & 0xffffffffffffffff).to_bytes(8, 'little')
+                    dest += pack(x >> 64, x & 0xffffffffffffffff)
                 else:
                     dest += empty
         elif isinstance(first, int):
             for x in column:
                 if x:
-                    dest += (x >> 64).to_bytes(8, 'little') + (x & 0xffffffffffffffff).to_bytes(8, 'little')
+                    dest += pack(x >> 64, x & 0xffffffffffffffff)
                 else:
                     dest += empty
         elif isinstance(first, PYUUID):
             for v in column:
                 if v:
                     x = v.int
-                    dest += (x >> 64).to_bytes(8, 'little') + (x & 0xffffffffffffffff).to_bytes(8, 'little')
+                    dest += pack(x >> 64, x & 0xffffffffffffffff)
                 else:
                     dest += empty
         elif isinstance(first, (bytes, bytearray, memoryview)):
-            for v in column:
-                if v:
-                    dest += bytes(reversed(v[:8])) + bytes(reversed(v[8:]))
-                else:
-                    dest += empty
+            # Python UUID bytes are big endian, so byte swapping every 8 byte half in a single
+            # array operation produces the two little endian UInt64 values for the entire column
+            values = [v if v else empty for v in column]
+            for v in values:
+                if len(v) != 16:
+                    raise DataError(f'UUID binary value {bytes(v).hex(" ")} is not 16 bytes')
+            halves = array.array('Q', b''.join(values))
+            halves.byteswap()
+            dest += halves
         else:
             dest += empty * len(column)
 
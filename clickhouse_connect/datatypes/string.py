@@ -1,5 +1,6 @@
 from typing import Sequence, MutableSequence, Union, Collection
 
+from clickhouse_connect import common
 from clickhouse_connect.driver.ctypes import data_conv
 
 from clickhouse_connect.datatypes.base import ClickHouseType, TypeDef
@@ -77,8 +78,13 @@ class FixedString(ClickHouseType):
 
     def _read_column_binary(self, source: ByteSource, num_rows: int, ctx: QueryContext):
         if self.read_format(ctx) == 'string':
-            return source.read_fixed_str_col(self.byte_size, num_rows, ctx.encoding or self.encoding )
-        return source.read_bytes_col(self.byte_size, num_rows)
+            column = source.read_fixed_str_col(self.byte_size, num_rows, ctx.encoding or self.encoding)
+        else:
+            column = source.read_bytes_col(self.byte_size, num_rows)
+        if common.get_setting('intern_fixed_strings'):
+            intern = {}.setdefault
+            return [intern(x, x) for x in column]
+        return column
 
     def _finalize_column(self, column: Sequence, ctx: QueryContext) -> Sequence:
         if ctx.use_extended_dtypes and self.read_format(ctx) == 'string':
@@ -105,8 +111,7 @@ class FixedString(ClickHouseType):
                             b = empty
                         if len(b) > sz:
                             raise DataError(f'UTF-8 encoded FixedString value {b.hex(" ")} exceeds column size {sz}')
-                        ext(b)
-                        ext(empty[:sz - len(b)])
+                        ext(b.ljust(sz, b'\x00'))
             else:
                 for x in column:
                     try:
@@ -115,18 +120,20 @@ class FixedString(ClickHouseType):
                         b = empty
                     if len(b) > sz:
                         raise DataError(f'UTF-8 encoded FixedString value {b.hex(" ")} exceeds column size {sz}')
-                    ext(b)
-                    ext(empty[:sz - len(b)])
+                    ext(b.ljust(sz, b'\x00'))
         elif self.nullable:
+            parts = []
+            app = parts.append
             for b in column:
                 if not b:
-                    ext(empty)
+                    app(empty)
                 elif len(b) != sz:
                     raise DataError(f'Fixed String binary value {b.hex(" ")} does not match column size {sz}')
                 else:
-                    ext(b)
+                    app(b)
+            dest += b''.join(parts)
         else:
             for b in column:
                 if len(b) != sz:
                     raise DataError(f'Fixed String binary value {b.hex(" ")} does not match column size {sz}')
-                ext(b)
+            dest += b''.join(column)
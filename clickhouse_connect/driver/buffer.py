@@ -1,11 +1,14 @@
+import codecs
 import sys
 import array
+import struct
 from typing import Any, Iterable
 
 from clickhouse_connect.driver.exceptions import StreamCompleteException
 from clickhouse_connect.driver.types import ByteSource
 
 must_swap = sys.byteorder == 'big'
+ascii_compatible = {codecs.lookup(enc).name for enc in ('utf8', 'ascii', 'latin1')}
 
 
 class ResponseBuffer(ByteSource):
@@ -23,8 +26,19 @@ class ResponseBuffer(ByteSource):
         if self.buf_loc + sz <= self.buf_sz:
             self.buf_loc += sz
             return self.buffer[self.buf_loc - sz: self.buf_loc]
+        return self._read_bridge(sz)
+
+    def _read_view(self, sz: int):
+        # Version of read_bytes for data that is immediately converted (such as arrays and fixed size columns).
+        # The returned view references the current chunk instead of copying the requested bytes out of it
+        if self.buf_loc + sz <= self.buf_sz:
+            self.buf_loc += sz
+            return memoryview(self.buffer)[self.buf_loc - sz: self.buf_loc]
+        return self._read_bridge(sz)
+
+    def _read_bridge(self, sz: int):
         # Create a temporary buffer that bridges two or more source chunks
-        bridge = bytearray(self.buffer[self.buf_loc: self.buf_sz])
+        bridge = bytearray(memoryview(self.buffer)[self.buf_loc: self.buf_sz])
         self.buf_loc = 0
         self.buf_sz = 0
         while len(bridge) < sz:
@@ -36,7 +50,7 @@ class ResponseBuffer(ByteSource):
                 bridge.extend(chunk)
             else:
                 tail = sz - len(bridge)
-                bridge.extend(chunk[:tail])
+                bridge.extend(memoryview(chunk)[:tail])
                 self.buffer = chunk
                 self.buf_sz = x
                 self.buf_loc = tail
@@ -83,16 +97,23 @@ class ResponseBuffer(ByteSource):
         column = []
         app = column.append
         null_map = self.read_bytes(num_rows) if nullable else None
+        read_leb128 = self.read_leb128
+        read_bytes = self.read_bytes
         for ix in range(num_rows):
-            sz = 0
-            shift = 0
-            while True:
-                b = self.read_byte()
-                sz += ((b & 0x7f) << shift)
-                if (b & 0x80) == 0:
-                    break
-                shift += 7
-            x = self.read_bytes(sz)
+            # Fast path for the common case of a single byte LEB128 length and string data that is entirely
+            # within the current chunk -- this avoids method calls for each byte of the length prefix
+            loc = self.buf_loc
+            if loc < self.buf_sz and self.buffer[loc] < 0x80:
+                sz = self.buffer[loc]
+                loc += 1
+                if loc + sz <= self.buf_sz:
+                    x = self.buffer[loc: loc + sz]
+                    self.buf_loc = loc + sz
+                else:
+                    self.buf_loc = loc
+                    x = read_bytes(sz)
+            else:
+                x = read_bytes(read_leb128())
             if null_map and null_map[ix]:
                 app(null_obj)
             elif encoding:
@@ -105,11 +126,16 @@ class ResponseBuffer(ByteSource):
         return column
 
     def read_bytes_col(self, sz: int, num_rows: int) -> Iterable[bytes]:
-        source = self.read_bytes(sz * num_rows)
-        return [bytes(source[x:x+sz]) for x in range(0, sz * num_rows, sz)]
+        source = self._read_view(sz * num_rows)
+        # A single (uncached) Struct splits the whole block in one C loop rather than slicing each row in Python
+        return struct.Struct(f'{sz}s' * num_rows).unpack_from(source)
 
     def read_fixed_str_col(self, sz: int, num_rows: int, encoding: str) -> Iterable[str]:
         source = self.read_bytes(sz * num_rows)
+        if source.isascii() and codecs.lookup(encoding).name in ascii_compatible:
+            # Every byte is a single character, so decode the whole block once and slice the resulting string
+            text = source.decode('ascii')
+            return [text[ix: ix + sz].rstrip('\x00') for ix in range(0, sz * num_rows, sz)]
         column = []
         app = column.append
         for ix in range(0, sz * num_rows, sz):
@@ -122,8 +148,7 @@ class ResponseBuffer(ByteSource):
     def read_array(self, array_type: str, num_rows: int) -> Iterable[Any]:
         column = array.array(array_type)
         sz = column.itemsize * num_rows
-        b = self.read_bytes(sz)
-        column.frombytes(b)
+        column.frombytes(self._read_view(sz))
         if must_swap:
             column.byteswap()
         return column
@@ -1,5 +1,6 @@
 import array
 from datetime import datetime, date, tzinfo
+from itertools import chain, islice
 from ipaddress import IPv4Address
 from typing import Sequence, Optional, Any
 from uuid import UUID, SafeUUID
@@ -62,15 +63,19 @@ def read_date32_col(source: ByteSource, num_rows: int):
 
 def read_uuid_col(source: ByteSource, num_rows: int):
     v = source.read_array('Q', num_rows * 2)
+    if np is not None:
+        # Combine the high and low UInt64 halves of every UUID in a single Numpy object array operation
+        halves = np.frombuffer(v, dtype=np.uint64)
+        int_values = ((halves[0::2].astype(object) << 64) | halves[1::2].astype(object)).tolist()
+    else:
+        int_values = [v[ix] << 64 | v[ix + 1] for ix in range(0, num_rows * 2, 2)]
     empty_uuid = UUID(int=0)
     new_uuid = UUID.__new__
     unsafe = SafeUUID.unsafe
     oset = object.__setattr__
     column = []
     app = column.append
-    for i in range(num_rows):
-        ix = i << 1
-        int_value = v[ix] << 64 | v[ix + 1]
+    for int_value in int_values:
         if int_value == 0:
             app(empty_uuid)
         else:
@@ -101,6 +106,25 @@ def build_lc_nullable_column(index: Sequence, keys: array.array, null_obj: Any):
     return column
 
 
+def build_array_column(source: list, offsets: array.array):
+    return [source[start: end] for start, end in zip(chain((0,), offsets), offsets)]
+
+
+def build_map_column(keys: Sequence, values: Sequence, offsets: array.array):
+    # Stream the key/value pairs into each dictionary rather than materializing and slicing a tuple of all pairs
+    all_pairs = zip(keys, values)
+    column = []
+    app = column.append
+    last = 0
+    for offset in offsets:
+        if offset > last:
+            app(dict(islice(all_pairs, offset - last)))
+            last = offset
+        else:
+            app({})
+    return column
+
+
 def to_numpy_array(column: Sequence):
     arr = np.empty((len(column),), dtype=np.object)
     arr[:] = column
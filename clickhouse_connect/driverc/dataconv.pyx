@@ -8,9 +8,12 @@ import cython
 
 from .buffer cimport ResponseBuffer
 from cpython cimport Py_INCREF, Py_DECREF
+from cpython.object cimport PyObject_GenericSetAttr
 from cpython.buffer cimport PyBUF_READ
 from cpython.mem cimport PyMem_Free, PyMem_Malloc
 from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+from cpython.list cimport PyList_New, PyList_SET_ITEM, PyList_GetSlice
+from cpython.dict cimport PyDict_New, PyDict_SetItem
 from cpython.bytearray cimport PyByteArray_GET_SIZE, PyByteArray_Resize
 from cpython.memoryview cimport PyMemoryView_FromMemory
 from cython.view cimport array as cvarray
@@ -21,6 +24,9 @@ from datetime import tzinfo
 
 from clickhouse_connect.driver.errors import NONE_IN_NULLABLE_COLUMN
 
+cdef extern from "Python.h":
+    object _PyLong_FromByteArray(const unsigned char* bytes, size_t n, int little_endian, int is_signed)
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def pivot(data: Sequence, unsigned long long start, unsigned long long end):
@@ -171,19 +177,22 @@ cpdef inline object epoch_days_to_date(int days):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def read_uuid_col(ResponseBuffer buffer, unsigned long long num_rows):
+    if num_rows == 0:
+        return ()
     cdef unsigned long long x = 0
     cdef char * loc = buffer.read_bytes_c(16 * num_rows)
     cdef char[16] temp
     cdef object column = PyTuple_New(num_rows), v
     new_uuid = UUID.__new__
     unsafe = SafeUUID.unsafe
-    oset = object.__setattr__
+    # UUID overrides __setattr__ to make instances immutable, so set the slots with the generic
+    # implementation directly (equivalent to object.__setattr__ but without two Python calls per row)
     for x in range(num_rows):
         memcpy (<void *>temp, <void *>(loc + 8), 8)
         memcpy (<void *>(temp + 8), <void *>loc, 8)
         v = new_uuid(UUID)
-        oset(v, 'int', int.from_bytes(temp[:16], 'little'))
-        oset(v, 'is_safe', unsafe)
+        PyObject_GenericSetAttr(v, 'int', _PyLong_FromByteArray(<unsigned char *>temp, 16, 1, 0))
+        PyObject_GenericSetAttr(v, 'is_safe', unsafe)
         PyTuple_SET_ITEM(column, x, v)
         Py_INCREF(v)
         loc += 16
@@ -246,6 +255,39 @@ def build_lc_nullable_column(index: Sequence, keys: array.array, object null_obj
     return column
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def build_array_column(list source, const unsigned long long[:] offsets):
+    cdef Py_ssize_t num_rows = offsets.shape[0], x
+    cdef unsigned long long last = 0, offset
+    cdef object column = PyList_New(num_rows), v
+    for x in range(num_rows):
+        offset = offsets[x]
+        v = PyList_GetSlice(source, last, offset)
+        PyList_SET_ITEM(column, x, v)
+        Py_INCREF(v)
+        last = offset
+    return column
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def build_map_column(keys: Sequence, values: Sequence, const unsigned long long[:] offsets):
+    cdef Py_ssize_t num_rows = offsets.shape[0], x
+    cdef unsigned long long ix = 0, offset
+    cdef unsigned long long num_pairs = min(len(keys), len(values))
+    cdef object column = PyList_New(num_rows), v
+    for x in range(num_rows):
+        offset = offsets[x]
+        v = PyDict_New()
+        while ix < offset and ix < num_pairs:
+            PyDict_SetItem(v, keys[ix], values[ix])
+            ix += 1
+        PyList_SET_ITEM(column, x, v)
+        Py_INCREF(v)
+    return column
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef inline extend_byte_array(target: bytearray, int start, object source, Py_ssize_t sz):
@@ -37,3 +37,25 @@ def test_read_bytes():
             buff.read_bytes(10)
         except StreamCompleteException:
             pass
+
+
+def test_read_bytes_col():
+    for cls in CResponseBuffer, PyResponseBuffer:
+        buff = bytes_source('43 44 4d 41 22 44 66 88 AA 01', chunk_size=4, cls=cls)
+        assert list(buff.read_bytes_col(3, 3)) == [b'\x43\x44\x4d', b'\x41\x22\x44', b'\x66\x88\xAA']
+        assert buff.read_byte() == 0x01
+
+
+def test_read_fixed_str_col():
+    for cls in CResponseBuffer, PyResponseBuffer:
+        buff = bytes_source('43 44 4d 41 c3 a9 41 42', chunk_size=3, cls=cls)
+        assert list(buff.read_fixed_str_col(2, 2, 'utf8')) == ['CD', 'MA']
+        assert list(buff.read_fixed_str_col(2, 2, 'utf8')) == ['é', 'AB']
+
+
+def test_read_str_col():
+    long_str = 'x' * 130
+    data = bytes.fromhex('02 41 42 02 43 44 03 45 46 47 82 01') + long_str.encode()
+    for cls in CResponseBuffer, PyResponseBuffer:
+        buff = bytes_source(data, chunk_size=4, cls=cls)
+        assert list(buff.read_str_col(4, 'utf8')) == ['AB', 'CD', 'EFG', long_str]
@@ -1,7 +1,17 @@
+import array
+import struct
 from datetime import date
-from clickhouse_connect.driver.dataconv import epoch_days_to_date as py_date, pivot as py_pivot
+from uuid import UUID
+
+from clickhouse_connect.driver import dataconv
+from clickhouse_connect.driver.buffer import ResponseBuffer as PyResponseBuffer
+from clickhouse_connect.driver.dataconv import epoch_days_to_date as py_date, pivot as py_pivot, \
+    build_map_column as py_build_map, build_array_column as py_build_array, read_uuid_col as py_read_uuid
 # pylint: disable=no-name-in-module
-from clickhouse_connect.driverc.dataconv import epoch_days_to_date as c_date, pivot as c_pivot
+from clickhouse_connect.driverc.buffer import ResponseBuffer as CResponseBuffer
+from clickhouse_connect.driverc.dataconv import epoch_days_to_date as c_date, pivot as c_pivot, \
+    build_map_column as c_build_map, build_array_column as c_build_array, read_uuid_col as c_read_uuid
+from tests.helpers import bytes_source
 
 
 def test_date_conv():
@@ -35,3 +45,29 @@ def test_pivot():
     for pivot in (c_pivot, py_pivot):
         result = pivot(data, 0, 2)
         assert result == ((1, 4), (2, 5), (3, 6))
+
+
+def test_build_map_column():
+    for build_map in (c_build_map, py_build_map):
+        offsets = array.array('Q', [1, 1, 3])
+        assert build_map(['a', 'b', 'c'], [1, 2, 3], offsets) == [{'a': 1}, {}, {'b': 2, 'c': 3}]
+        offsets = array.array('Q', [5, 2])
+        assert build_map(['a', 'b'], ['c', 'd'], offsets) == [{'a': 'c', 'b': 'd'}, {}]
+
+
+def test_build_array_column():
+    for build_array in (c_build_array, py_build_array):
+        assert build_array([], array.array('Q')) == []
+        assert build_array([1, 2, 3], array.array('Q', [0, 2, 2, 3])) == [[], [1, 2], [], [3]]
+        assert build_array([1, 2], array.array('Q', [1, 4])) == [[1], [2]]
+
+
+def test_read_uuid_col(monkeypatch):
+    uuids = [UUID(int=0), UUID('ffffffff-0000-0000-8000-000000000001'), UUID('1d439f79-c57d-5f23-52c6-ffccca93e1a9')]
+    data = b''.join(struct.pack('<QQ', x.int >> 64, x.int & 0xffffffffffffffff) for x in uuids)
+    for read_uuid, cls in ((c_read_uuid, CResponseBuffer), (py_read_uuid, PyResponseBuffer)):
+        assert list(read_uuid(bytes_source(data, cls=cls), 3)) == uuids
+        assert not read_uuid(bytes_source(data, cls=cls), 0)
+    monkeypatch.setattr(dataconv, 'np', None)
+    assert py_read_uuid(bytes_source(data, cls=PyResponseBuffer), 3) == uuids
+    assert not py_read_uuid(bytes_source(data, cls=PyResponseBuffer), 0)
@@ -1,8 +1,12 @@
 from ipaddress import IPv4Address
 from uuid import UUID
 
+import pytest
+
+from clickhouse_connect import common
 from clickhouse_connect.datatypes import registry
 from clickhouse_connect.driver.context import BaseQueryContext
+from clickhouse_connect.driver.exceptions import DataError
 from clickhouse_connect.driver.query import QueryContext
 from clickhouse_connect.driver.transform import NativeTransform
 from tests.helpers import bytes_source
@@ -88,6 +92,29 @@ def test_map():
     check_result(result, {'george': UUID('1d439f79-c57d-5f23-52c6-ffccca93e1a9'), 'igor': None})
 
 
+def test_map_rows():
+    maps = [{'a': 1, 'b': 2}, {}, {'c': 3}]
+    map_type = registry.get_from_name('Map(String, UInt16)')
+    dest = bytearray()
+    map_type.write_column(maps, dest, BaseQueryContext())
+    python = map_type.read_column(bytes_source(bytes(dest)), 3, QueryContext())
+    assert list(python) == maps
+
+
+def test_interned_fixed_string():
+    values = [b'USD', b'EUR', b'USD', b'USD']
+    fs_type = registry.get_from_name('FixedString(3)')
+    dest = bytearray()
+    fs_type.write_column(values, dest, BaseQueryContext())
+    common.set_setting('intern_fixed_strings', True)
+    try:
+        python = fs_type.read_column(bytes_source(bytes(dest)), 4, QueryContext())
+    finally:
+        common.set_setting('intern_fixed_strings', False)
+    assert list(python) == values
+    assert python[0] is python[2] and python[0] is python[3]
+
+
 def test_ip():
     ips = ['192.168.5.3', '202.44.8.25', '0.0.2.2']
     ipv4_type = registry.get_from_name('IPv4')
@@ -97,6 +124,47 @@ def test_ip():
     assert tuple(python) == tuple(IPv4Address(ip) for ip in ips)
 
 
+def test_uuid_str():
+    uuids = [UUID('1d439f79-c57d-5f23-52c6-ffccca93e1a9'), UUID(int=0), UUID('0123abcd-4567-89ef-fedc-ba9876543210')]
+    uuid_type = registry.get_from_name('UUID')
+    dest = bytearray()
+    uuid_type.write_column(uuids, dest, BaseQueryContext())
+    python = uuid_type.read_column(bytes_source(bytes(dest)), 3, QueryContext(query_formats={'UUID': 'string'}))
+    assert list(python) == [str(x) for x in uuids]
+
+
+
+def test_uuid_bytes():
+    uuids = [UUID('1d439f79-c57d-5f23-52c6-ffccca93e1a9'), UUID(int=0), UUID('0123abcd-4567-89ef-fedc-ba9876543210')]
+    uuid_type = registry.get_from_name('UUID')
+    dest = bytearray()
+    uuid_type.write_column([x.bytes for x in uuids], dest, BaseQueryContext())
+    python = uuid_type.read_column(bytes_source(bytes(dest)), 3, QueryContext())
+    assert list(python) == uuids
+    for bad_values in ([b'short'], [b'\x01' * 17], [b'x' * 12, b'y' * 20]):
+        with pytest.raises(DataError):
+            uuid_type.write_column(bad_values, bytearray(), BaseQueryContext())
+
+def test_nested_int_array():
+    arrays = [[[1, 2], []], [], [[3], [4, 5, 6]]]
+    array_type = registry.get_from_name('Array(Array(Int32))')
+    dest = bytearray()
+    array_type.write_column(arrays, dest, BaseQueryContext())
+    python = array_type.read_column(bytes_source(bytes(dest)), 3, QueryContext())
+    assert list(python) == arrays
+
+
+def test_named_tuple():
+    tuples = [{'a': 1, 'b': 'one'}, {'a': 2, 'b': 'two'}, {'a': 3, 'b': ''}]
+    tuple_type = registry.get_from_name('Tuple(a Int32, b String)')
+    dest = bytearray()
+    tuple_type.write_column(tuples, dest, BaseQueryContext())
+    python = tuple_type.read_column(bytes_source(bytes(dest)), 3, QueryContext())
+    assert list(python) == tuples
+    python = tuple_type.read_column(bytes_source(bytes(dest)), 3, QueryContext(query_formats={'Tuple': 'tuple'}))
+    assert list(python) == [(1, 'one'), (2, 'two'), (3, '')]
+
+
 def test_point():
     points = ((3.22, 3.22),(5.22, 5.22),(4.22, 4.22))
     point_type = registry.get_from_name('Point')
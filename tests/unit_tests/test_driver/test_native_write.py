@@ -1,4 +1,7 @@
-from clickhouse_connect.driver.exceptions import ProgrammingError
+import pytest
+
+from clickhouse_connect.driver.context import BaseQueryContext
+from clickhouse_connect.driver.exceptions import ProgrammingError, DataError
 
 from clickhouse_connect.datatypes.registry import get_from_name
 from tests.helpers import to_bytes, native_insert_block
@@ -119,6 +122,18 @@ def test_long_str():
     assert bytes(output) == b'\x01\x01\x05value\x06String\xe7\x03' + x.encode()
 
 
+def test_json():
+    data = [[{'key': 'x' * 150}], [{}]]
+    names = ['value']
+    types = [get_from_name('JSON')]
+    output = native_insert_block(data, names, types)
+    assert bytes(output) == b'\x01\x02\x05value\x04JSON\x01\xa0\x01{"key":"' + b'x' * 150 + b'"}\x02{}'
+    output = native_insert_block([['{"key":1}'], ['']], names, types)
+    assert bytes(output) == b'\x01\x02\x05value\x04JSON\x01\x09{"key":1}\x00'
+    with pytest.raises(DataError):
+        types[0].write_column(['{"key":1}', None], bytearray(), BaseQueryContext())
+
+
 def test_low_card_map():
     data = [[{'key1': '1', 'key2': 'two'}], [{}]]
     names = ['MAP']